@@ -0,0 +1,90 @@
+"""
+Minimal .env file loader.
+
+Supports the subset of the dotenv format this project uses:
+
+    # comment
+    KEY=value
+    KEY=value  # inline comment (unquoted values only)
+    export KEY=value
+    KEY="quoted value"  /  KEY='quoted value'
+
+There is no variable expansion or multi-line values. Variables already set in
+the environment are never overridden.
+"""
+import os
+import re
+from typing import Dict
+
+_DOUBLE_QUOTE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+# A "#" preceded by any whitespace starts an inline comment; "a#b" is a value
+_INLINE_COMMENT = re.compile(r"\s#")
+_EXPORT = re.compile(r"export\s+")
+
+
+def _unquote(value: str) -> str:
+    """Strip surrounding quotes (or a trailing inline comment) from a raw value"""
+    # Leading whitespace is kept until the comment check, so "KEY= # note" is empty
+    quoted = value.lstrip()
+    if quoted.startswith('"'):
+        # Read up to the closing quote, expanding backslash escapes
+        chars = []
+        i = 1
+        while i < len(quoted) and quoted[i] != '"':
+            if quoted[i] == "\\" and i + 1 < len(quoted):
+                i += 1
+                chars.append(_DOUBLE_QUOTE_ESCAPES.get(quoted[i], "\\" + quoted[i]))
+            else:
+                chars.append(quoted[i])
+            i += 1
+        return "".join(chars)
+
+    if quoted.startswith("'"):
+        end = quoted.find("'", 1)
+        if end != -1:
+            return quoted[1:end]
+
+    comment = _INLINE_COMMENT.search(value)
+    if comment is not None:
+        value = value[:comment.start()]
+    return value.strip()
+
+
+def parse_envfile(path: str) -> Dict[str, str]:
+    """
+    Parse a .env file into a dict.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Mapping of variable names to values, in file order
+    """
+    values = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            export = _EXPORT.match(line)
+            if export is not None:
+                line = line[export.end():]
+
+            name, sep, value = line.partition("=")
+            name = name.strip()
+            if not sep or not name:
+                continue
+            values[name] = _unquote(value)
+    return values
+
+
+def load_envfile(path: str) -> None:
+    """
+    Load variables from a .env file into os.environ.
+
+    Args:
+        path: Path to the .env file
+    """
+    for name, value in parse_envfile(path).items():
+        os.environ.setdefault(name, value)
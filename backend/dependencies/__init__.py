@@ -1,31 +1,32 @@
 from typing import AsyncIterator
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import async_session_maker
+from services.investigation_service import InvestigationService
+from services.page_fetcher_service import PageFetcherService
+from services.user_service import UserService
 
 
-async def get_db() -> AsyncIterator[AsyncSession]:
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
     """
     Async database session dependency for FastAPI routes.
 
+    Sessions come from the sessionmaker created in the application lifespan
+    and stored on ``app.state``.
+
+    The session is not committed automatically; services that mutate state
+    commit explicitly, so read-only requests never pay for a COMMIT.
+
     Usage:
         @router.get("/users")
         async def get_users(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    async with request.app.state.sessionmaker() as session:
+        yield session
 
 
 # Service Dependencies
-def get_user_service(db: AsyncSession = Depends(get_db)):
+async def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
     """
     Dependency injection for UserService.
 
@@ -37,6 +38,26 @@ def get_user_service(db: AsyncSession = Depends(get_db)):
         ):
             return await user_service.get_by_id(user_id)
     """
-    from services.user_service import UserService
-
     return UserService(db)
+
+
+async def get_investigation_service(request: Request) -> InvestigationService:
+    """
+    Dependency injection for the app-wide InvestigationService.
+
+    The instance is created once in the application lifespan and stored on
+    ``app.state``, so agents and clients are reused across requests.
+    """
+    service: InvestigationService = request.app.state.investigation_service
+    return service
+
+
+async def get_page_fetcher_service(request: Request) -> PageFetcherService:
+    """
+    Dependency injection for the app-wide PageFetcherService.
+
+    The instance is created once in the application lifespan and stored on
+    ``app.state``.
+    """
+    service: PageFetcherService = request.app.state.page_fetcher_service
+    return service
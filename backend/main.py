@@ -1,24 +1,59 @@
+import os
 import uvicorn
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from server import create_server
 from routers import api, user, investigation, page_fetcher
-from models import init_db, close_db
+from settings import get_settings
+from models import create_db_engine, create_session_maker, init_db, close_db
+from services.investigation_service import InvestigationService
+from services.page_fetcher_service import PageFetcherService
+from services.web_service import close_http_clients
+
+
+def merge_lifespans(*lifespans):
+    """
+    Compose several lifespan context managers into one.
+
+    Child lifespans are entered in order and exited in reverse, so sub-apps
+    (MCP servers, background workers) can add their own startup/shutdown
+    without replacing the database lifespan.
+    """
+
+    @asynccontextmanager
+    async def merged_lifespan(app):
+        async with AsyncExitStack() as stack:
+            for child in lifespans:
+                await stack.enter_async_context(child(app))
+            yield
+
+    return merged_lifespan
 
 
 @asynccontextmanager
-async def lifespan(app):
+async def db_lifespan(app):
     """
     Async context manager for FastAPI lifespan events.
     Handles startup and shutdown of database connections.
     """
     # Startup
-    await init_db()
+    app.state.engine = create_db_engine()
+    app.state.sessionmaker = create_session_maker(app.state.engine)
+    await init_db(app.state.engine)
     yield
     # Shutdown
-    await close_db()
+    await close_db(app.state.engine)
+
+
+@asynccontextmanager
+async def services_lifespan(app):
+    """Create app-wide service singletons shared by all requests"""
+    app.state.investigation_service = InvestigationService()
+    app.state.page_fetcher_service = PageFetcherService()
+    yield
+    await close_http_clients()
 
 
-app = create_server(lifespan=lifespan)
+app = create_server(lifespan=merge_lifespans(db_lifespan, services_lifespan))
 
 # Include API routers
 app.include_router(api.router)
@@ -27,4 +62,14 @@ app.include_router(investigation.router)
 app.include_router(page_fetcher.router)
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", reload=True, host="0.0.0.0", port=8000)
+    is_local = get_settings().release_stage == "local"
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        # Reload only supports a single worker, so use one process per core outside local
+        workers=1 if is_local else os.cpu_count(),
+        reload=is_local,
+    )
@@ -7,7 +7,7 @@ from alembic import context
 
 # Import your models and settings
 from models import Base
-from settings import DATABASE_URL
+from settings import get_settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -23,7 +23,8 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 # Override sqlalchemy.url with the one from settings
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+# ("%" is escaped because the config parser treats it as interpolation)
+config.set_main_option("sqlalchemy.url", get_settings().database_url.replace("%", "%%"))
 
 
 def run_migrations_offline() -> None:
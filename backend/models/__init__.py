@@ -1,28 +1,53 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import DeclarativeBase
-from settings import DATABASE_URL, RELEASE_STAGE
-
-# Convert sync DATABASE_URL to async (replace mysql+pymysql with mysql+aiomysql)
-ASYNC_DATABASE_URL = DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://")
-
-# Create async SQLAlchemy engine
-async_engine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    echo=RELEASE_STAGE == "local",  # Enable SQL logging in local development
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=24,
-    max_overflow=48,
-    pool_recycle=3600,  # Recycle connections after 1 hour
+import asyncio
+import logging
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from sqlalchemy import text
+from sqlalchemy.orm import DeclarativeBase
+from settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_db_engine() -> AsyncEngine:
+    """
+    Create the async SQLAlchemy engine.
+
+    Called once per worker from the application lifespan, so pool settings
+    are resolved at boot rather than at import time.
+    """
+    settings = get_settings()
+    # Convert sync database_url to async (replace mysql+pymysql with mysql+asyncmy)
+    async_database_url = settings.database_url.replace("mysql+pymysql://", "mysql+asyncmy://")
+
+    return create_async_engine(
+        async_database_url,
+        echo=settings.release_stage == "local",  # Enable SQL logging in local development
+        # No pre-ping: recycling below MySQL's wait_timeout avoids stale connections
+        # without paying a SELECT 1 round-trip on every checkout
+        pool_pre_ping=False,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+    )
+
+
+def create_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the async session factory bound to the given engine"""
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,  # Important for async
+        autocommit=False,
+        autoflush=False,
+    )
 
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,  # Important for async
-    autocommit=False,
-    autoflush=False,
-)
 
 # Base class for models (SQLAlchemy 2.0 style)
 class Base(DeclarativeBase):
@@ -30,14 +55,50 @@ class Base(DeclarativeBase):
 
 
 # Lifecycle events
-async def init_db():
-    """Initialize database connection on startup"""
-    async with async_engine.begin() as conn:
-        # Create tables if they don't exist (use Alembic in production)
-        # await conn.run_sync(Base.metadata.create_all)
-        pass
+async def _open_connection(engine: AsyncEngine) -> AsyncConnection:
+    """Check out a connection and verify it with SELECT 1"""
+    conn = await engine.connect()
+    try:
+        await conn.execute(text("SELECT 1"))
+    except BaseException:
+        await conn.close()
+        raise
+    return conn
+
+
+async def init_db(engine: AsyncEngine):
+    """
+    Initialize database connection on startup.
+
+    One verified connection is required; failures there abort startup. The
+    rest of the pool is warmed best-effort so the first requests after boot
+    don't pay the connect/auth handshake, without failing boot when the
+    server's max_connections is below pool_size * workers.
+    Tables are managed by Alembic.
+    """
+    pool_size = get_settings().database_pool_size
+    conns = [await _open_connection(engine)]
+    warm = await asyncio.gather(
+        *(_open_connection(engine) for _ in range(pool_size - 1)),
+        return_exceptions=True,
+    )
+    errors = []
+    for conn in warm:
+        if isinstance(conn, BaseException):
+            errors.append(conn)
+        else:
+            conns.append(conn)
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+    if errors:
+        logger.warning(
+            "Pool warm-up opened %d of %d connections; last error: %r",
+            len(conns),
+            pool_size,
+            errors[-1],
+        )
 
 
-async def close_db():
+async def close_db(engine: AsyncEngine):
     """Close database connection on shutdown"""
-    await async_engine.dispose()
+    await engine.dispose()
@@ -1 +1,17 @@
 # Routers package
+from functools import partial
+from typing import Any, Callable, Dict
+
+import orjson
+from fastapi import Response
+
+
+def json_bytes_response(payload: Dict[str, Any]) -> Callable[[], Response]:
+    """
+    Serialize a fixed JSON payload once and return a factory for its responses.
+
+    Meant for bodies that cannot change while the process runs, such as health
+    checks whose only inputs are the configured API keys. Each call wraps the
+    same bytes in a new Response, skipping jsonable_encoder and re-serializing.
+    """
+    return partial(Response, orjson.dumps(payload), media_type="application/json")
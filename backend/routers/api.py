@@ -1,10 +1,13 @@
 from fastapi import APIRouter, status
+from routers import json_bytes_response
 
 router = APIRouter(
     prefix="/api",
     tags=["api"],
 )
 
+_health_response = json_bytes_response({"status": "healthy", "message": "API is running"})
+
 
 @router.get(
     "/health",
@@ -15,4 +18,4 @@ async def health_check():
     """
     Health check endpoint to verify the API is running.
     """
-    return {"status": "healthy", "message": "API is running"}
+    return _health_response()
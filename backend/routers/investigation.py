@@ -1,20 +1,95 @@
-from fastapi import APIRouter, status
-from fastapi.responses import StreamingResponse
-from services.optimization_service import InvestigationService
-from schemas.request.optimization import InvestigationRequest
+import asyncio
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, status
+from sse_starlette.sse import EventSourceResponse
+from services.investigation_service import InvestigationService
+from schemas.request.investigation import InvestigationRequest
+from dependencies import get_investigation_service
+from routers import json_bytes_response
+from settings import get_settings
 
 router = APIRouter(
     prefix="/optimize",
     tags=["optimization"],
 )
 
+# Small SSE events are coalesced into larger frames before hitting the socket
+SSE_FLUSH_BYTES = 8192
+SSE_FLUSH_INTERVAL = 0.05  # Seconds an event may wait in the buffer
+
+_STREAM_END = object()
+
+_health_response = json_bytes_response({
+    "status": "healthy",
+    "openai_configured": bool(get_settings().openai.api_key),
+    "serpapi_configured": bool(get_settings().serpapi.api_key),
+})
+
+
+async def _coalesce_events(
+    events: AsyncIterator[str | bytes],
+    max_bytes: int = SSE_FLUSH_BYTES,
+    max_delay: float = SSE_FLUSH_INTERVAL,
+) -> AsyncIterator[bytes]:
+    """
+    Buffer SSE events and yield them in batches.
+
+    A background task drains ``events`` into a queue. The buffer is flushed once
+    it reaches ``max_bytes`` or its oldest event has waited ``max_delay``
+    seconds, so batching never delays an event by more than ``max_delay``.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for event in events:
+                await queue.put(event)
+        finally:
+            await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(pump())
+    buffer = bytearray()
+    deadline = None
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield bytes(buffer)
+                buffer.clear()
+                deadline = None
+                continue
+
+            if event is _STREAM_END:
+                break
+
+            buffer += event.encode() if isinstance(event, str) else event
+            if len(buffer) >= max_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+                deadline = None
+            elif deadline is None:
+                deadline = loop.time() + max_delay
+
+        if buffer:
+            yield bytes(buffer)
+        await producer  # Re-raise errors from the event source
+    finally:
+        producer.cancel()
+
 
 @router.post(
     "",
     name="AIO Investigation",
     status_code=status.HTTP_200_OK,
 )
-async def investigate_aio(request: InvestigationRequest):
+async def investigate_aio(
+    request: InvestigationRequest,
+    service: InvestigationService = Depends(get_investigation_service),
+):
     """
     Run AIO (AI Optimization) investigation for a given URL with keywords and location.
 
@@ -38,25 +113,24 @@ async def investigate_aio(request: InvestigationRequest):
     }
     ```
     """
-    service = InvestigationService()
-
-    async def event_generator():
-        """Generate SSE events from investigation service"""
-        async for event in service.investigate(
-            url=str(request.url),
-            keywords=request.keywords,
-            location=request.location,
-            language=request.language or "en",
-        ):
-            yield event
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
+    events = service.investigate(
+        url=request.url,
+        keywords=request.keywords,
+        location=request.location,
+        language=request.language or "en",
+    )
+
+    # Frames are already SSE-encoded bytes, which EventSourceResponse passes
+    # through as-is; it adds keep-alive pings and cancels the investigation
+    # when the client disconnects.
+    return EventSourceResponse(
+        _coalesce_events(events),
+        ping=15,
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Disable buffering in nginx
+            "Content-Encoding": "identity",  # Keep GZipMiddleware from buffering frames
         },
     )
 
@@ -68,10 +142,4 @@ async def investigate_aio(request: InvestigationRequest):
 )
 async def health_check():
     """Check if investigation service is properly configured"""
-    from settings import OPENAI_API_KEY, SERPAPI_API_KEY
-
-    return {
-        "status": "healthy",
-        "openai_configured": bool(OPENAI_API_KEY),
-        "serpapi_configured": bool(SERPAPI_API_KEY),
-    }
+    return _health_response()
@@ -1,17 +1,26 @@
-from fastapi import APIRouter, status, HTTPException
-from pydantic import HttpUrl, BaseModel, Field
+from fastapi import APIRouter, Depends, status, HTTPException
+from pydantic import BaseModel, Field
 from services.page_fetcher_service import PageFetcherService
+from dependencies import get_page_fetcher_service
+from routers import json_bytes_response
+from schemas.base import HttpUrlStr
+from settings import get_settings
 
 router = APIRouter(
     prefix="/page-fetcher",
     tags=["page-fetcher"],
 )
 
+_health_response = json_bytes_response({
+    "status": "healthy",
+    "openai_configured": bool(get_settings().openai.api_key),
+})
+
 
 class PageFetchRequest(BaseModel):
     """Request schema for page fetching"""
 
-    url: HttpUrl = Field(..., description="URL of the page to fetch")
+    url: HttpUrlStr = Field(..., description="URL of the page to fetch")
 
 
 class PageFetchResponse(BaseModel):
@@ -28,7 +37,10 @@ class PageFetchResponse(BaseModel):
     response_model=PageFetchResponse,
     status_code=status.HTTP_200_OK,
 )
-async def fetch_page(request: PageFetchRequest):
+async def fetch_page(
+    request: PageFetchRequest,
+    service: PageFetcherService = Depends(get_page_fetcher_service),
+):
     """
     Fetch plain text content from a web page using AI agent.
 
@@ -40,10 +52,9 @@ async def fetch_page(request: PageFetchRequest):
     - `content`: Plain text content of the page
     - `status`: Operation status
     """
-    service = PageFetcherService()
 
     try:
-        result = await service.fetch_page(str(request.url))
+        result = await service.fetch_page(request.url)
         return PageFetchResponse(**result)
     except Exception as e:
         raise HTTPException(
@@ -59,9 +70,4 @@ async def fetch_page(request: PageFetchRequest):
 )
 async def health_check():
     """Check if page fetcher service is properly configured"""
-    from settings import OPENAI_API_KEY
-
-    return {
-        "status": "healthy",
-        "openai_configured": bool(OPENAI_API_KEY),
-    }
+    return _health_response()
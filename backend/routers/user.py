@@ -1,5 +1,6 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from models.user import User
 from services.user_service import UserService
 from dependencies import get_user_service
 from schemas.request.user import UserCreateRequest, UserUpdateRequest
@@ -11,6 +12,23 @@ router = APIRouter(
 )
 
 
+def _to_user_response(user: User) -> UserResponse:
+    """
+    Build a UserResponse from a database row without re-running validation.
+
+    Rows were validated on the write path, so model_construct is safe here.
+    """
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        is_active=user.is_active,
+        is_superuser=user.is_superuser,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
 @router.get(
     "",
     response_model=UserListResponse,
@@ -28,11 +46,10 @@ async def list_users(
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (1-100)
     """
-    users = await user_service.get_all(skip=skip, limit=limit)
-    total = await user_service.count()
+    users, total = await user_service.list_with_total(skip=skip, limit=limit)
 
     return UserListResponse(
-        users=[UserResponse.model_validate(user) for user in users],
+        users=[_to_user_response(user) for user in users],
         total=total,
         skip=skip,
         limit=limit,
@@ -60,7 +77,7 @@ async def get_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found",
         )
-    return UserResponse.model_validate(user)
+    return _to_user_response(user)
 
 
 @router.post(
@@ -92,7 +109,7 @@ async def create_user(
             detail="User with this email already exists",
         )
 
-    return UserResponse.model_validate(user)
+    return _to_user_response(user)
 
 
 @router.patch(
@@ -127,7 +144,7 @@ async def update_user(
             detail=f"User with id {user_id} not found",
         )
 
-    return UserResponse.model_validate(user)
+    return _to_user_response(user)
 
 
 @router.delete(
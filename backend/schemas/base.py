@@ -1,4 +1,28 @@
-from pydantic import BaseModel, ConfigDict
+from typing import Annotated
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    HttpUrl,
+    StringConstraints,
+    TypeAdapter,
+)
+
+_http_url_adapter = TypeAdapter(HttpUrl)
+
+
+def _validate_http_url(value: str) -> str:
+    """Validate an HTTP(S) URL and return its normalized string form"""
+    return str(_http_url_adapter.validate_python(value))
+
+
+# Email addresses are checked by pydantic-core's Rust regex engine rather than
+# the email-validator package
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN, max_length=254)]
+
+# Validated like HttpUrl but stored as str, so handlers don't re-serialize it
+HttpUrlStr = Annotated[str, AfterValidator(_validate_http_url)]
 
 
 class BaseSchema(BaseModel):
@@ -1,12 +1,12 @@
 from typing import Optional, List
-from pydantic import Field, HttpUrl
-from schemas.base import BaseSchema
+from pydantic import Field
+from schemas.base import BaseSchema, HttpUrlStr
 
 
 class InvestigationRequest(BaseSchema):
     """Schema for AIO investigation request"""
 
-    url: HttpUrl = Field(..., description="Target URL to optimize")
+    url: HttpUrlStr = Field(..., description="Target URL to optimize")
     keywords: List[str] = Field(
         ..., min_length=1, max_length=10, description="Target keywords (1-10)"
     )
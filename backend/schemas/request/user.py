@@ -1,12 +1,12 @@
 from typing import Optional
-from pydantic import EmailStr, Field
-from schemas.base import BaseSchema
+from pydantic import Field
+from schemas.base import BaseSchema, Email
 
 
 class UserCreateRequest(BaseSchema):
     """Schema for creating a new user"""
 
-    email: EmailStr = Field(..., description="User email address")
+    email: Email = Field(..., description="User email address")
     password: str = Field(..., min_length=8, description="User password (min 8 characters)")
     full_name: Optional[str] = Field(None, max_length=255, description="User full name")
 
@@ -14,7 +14,7 @@ class UserCreateRequest(BaseSchema):
 class UserUpdateRequest(BaseSchema):
     """Schema for updating user information"""
 
-    email: Optional[EmailStr] = Field(None, description="New email address")
+    email: Optional[Email] = Field(None, description="New email address")
     full_name: Optional[str] = Field(None, max_length=255, description="New full name")
     is_active: Optional[bool] = Field(None, description="Account active status")
 
@@ -22,5 +22,5 @@ class UserUpdateRequest(BaseSchema):
 class UserLoginRequest(BaseSchema):
     """Schema for user login"""
 
-    email: EmailStr = Field(..., description="User email address")
+    email: Email = Field(..., description="User email address")
     password: str = Field(..., description="User password")
@@ -1,14 +1,14 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import EmailStr, Field
-from schemas.base import BaseSchema
+from pydantic import Field
+from schemas.base import BaseSchema, Email
 
 
 class UserResponse(BaseSchema):
     """Schema for user response (excludes sensitive data)"""
 
     id: int = Field(..., description="User ID")
-    email: EmailStr = Field(..., description="User email address")
+    email: Email = Field(..., description="User email address")
     full_name: Optional[str] = Field(None, description="User full name")
     is_active: bool = Field(..., description="Whether user account is active")
     is_superuser: bool = Field(..., description="Whether user has superuser privileges")
@@ -1,13 +1,10 @@
 from typing import Optional
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from settings import (
-    RELEASE_STAGE,
-    FRONTEND_URL,
-    API_TITLE,
-    API_VERSION,
-)
+from settings import get_settings
 
 
 def create_server(lifespan: Optional[asynccontextmanager] = None) -> FastAPI:
@@ -20,35 +17,44 @@ def create_server(lifespan: Optional[asynccontextmanager] = None) -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    settings = get_settings()
+
     # Disable docs in production
-    docs_url = "/docs" if RELEASE_STAGE != "production" else None
+    docs_url = "/docs" if settings.release_stage != "production" else None
     redoc_url = None  # Disable ReDoc
 
     app = FastAPI(
-        title=API_TITLE,
-        version=API_VERSION,
-        debug=RELEASE_STAGE == "local",
+        title=settings.api_title,
+        version=settings.api_version,
+        debug=settings.release_stage == "local",
         docs_url=docs_url,
         redoc_url=redoc_url,
+        default_response_class=ORJSONResponse,  # Serialize responses with orjson
         lifespan=lifespan,
     )
 
     # Configure CORS
-    origins = [FRONTEND_URL]
+    origins: tuple[str, ...] = (settings.frontend_url,)
 
-    if RELEASE_STAGE == "local":
+    if settings.release_stage == "local":
         # Allow additional origins in local development
-        origins.extend([
+        origins += (
             "http://localhost:3000",
             "http://localhost:8000",
-        ])
+        )
 
+    # Explicit lists instead of "*" so preflights aren't answered by echoing
+    # the requested headers back
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["authorization", "content-type", "x-requested-with"],
     )
 
+    # Compress larger JSON bodies; responses that set Content-Encoding (SSE
+    # streams) are passed through untouched
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     return app
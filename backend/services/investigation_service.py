@@ -1,225 +1,411 @@
 import asyncio
 import json
+import re
+import time
 from datetime import datetime
-from typing import AsyncIterator, Dict, Any, List
+from typing import AsyncIterator, Dict, Any, Generic, Hashable, List, Optional, Tuple, TypeVar, cast
+from urllib.parse import urlparse
 from uuid import uuid4
 
-from agents import Agent, Runner
-from serpapi import GoogleSearch
+import orjson
+from agents import Agent, Runner, function_tool
+from selectolax.lexbor import LexborHTMLParser
 
-from settings import OPENAI_API_KEY, SERPAPI_API_KEY
+from services.web_service import fetch_html, get_http_client
+from settings import get_settings
 
+SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
 
-class InvestigationService:
-    """Service for AIO (AI Optimization) investigation using OpenAI Agents and SerpAPI"""
+_WHITESPACE_RE = re.compile(r"\s+")
 
-    def __init__(self):
-        self.openai_api_key = OPENAI_API_KEY
-        self.serpapi_key = SERPAPI_API_KEY
-        self._setup_agents()
+# A numbered ("1." / "1)") or bulleted ("-" / "•") list item and its text
+_RECOMMENDATION_RE = re.compile(r"^\s*(?:\d+[.)]|[-•])\s+(.+?)\s*$")
 
-    def _setup_agents(self):
-        """Initialize OpenAI agents for AIO investigation"""
 
-        # Define tool functions for agents
-        def search_google(query: str, location: str = "United States") -> str:
-            """
-            Search Google for a query and return results.
+class _RateLimiter:
+    """Async limiter that spaces calls to at most ``rate`` per second (0 disables it)"""
 
-            Args:
-                query: The search query
-                location: Geographic location for search
+    def __init__(self, rate: float):
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
 
-            Returns:
-                JSON string with search results
-            """
-            params = {
-                "q": query,
-                "location": location,
-                "api_key": self.serpapi_key,
-            }
-            search = GoogleSearch(params)
-            results = search.get_dict()
-
-            # Return top 5 organic results
-            organic = results.get("organic_results", [])[:5]
-            return json.dumps({
-                "query": query,
-                "results": [
-                    {
-                        "title": r.get("title"),
-                        "link": r.get("link"),
-                        "snippet": r.get("snippet"),
-                        "position": r.get("position"),
-                    }
-                    for r in organic
-                ]
-            }, indent=2)
-
-        def fetch_url_content(url: str) -> str:
-            """
-            Fetch and extract main content from a URL.
+    async def wait(self):
+        if not self._interval:
+            return
 
-            Args:
-                url: The URL to fetch
+        now = asyncio.get_running_loop().time()
+        delay = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-            Returns:
-                Main text content from the page
-            """
-            import requests
-            from bs4 import BeautifulSoup
 
-            try:
-                response = requests.get(url, timeout=10, headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; SEOBot/1.0)"
-                })
-                response.raise_for_status()
+_V = TypeVar("_V")
 
-                soup = BeautifulSoup(response.text, 'html.parser')
 
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
+class _TTLCache(Generic[_V]):
+    """
+    In-process cache with per-entry expiry and a size cap.
 
-                # Get text
-                text = soup.get_text()
+    ``lock(key)`` hands out one asyncio.Lock per key, so concurrent misses for
+    the same key wait for a single lookup instead of all hitting the upstream.
+    Callers ``release_lock`` once the fill is done so the lock table only holds
+    keys with a fill in flight.
+    """
 
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, _V]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
 
-                # Extract meta data
-                title = soup.find('title')
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
+    def get(self, key: Hashable) -> Optional[_V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._locks.pop(key, None)
+            return None
+        return value
 
-                return json.dumps({
-                    "url": url,
-                    "title": title.string if title else "No title",
-                    "meta_description": meta_desc.get('content') if meta_desc else "No description",
-                    "content": text[:2000],  # First 2000 chars
-                    "content_length": len(text),
-                }, indent=2)
-
-            except Exception as e:
-                return json.dumps({"error": str(e), "url": url})
-
-        # Agent for web investigation
-        self.investigator_agent = Agent(
-            name="Web Investigator",
-            instructions="""
-            You are a web research specialist. Your job is to investigate URLs and gather data.
-
-            Use the available tools to:
-            1. Fetch and analyze the target URL's content
-            2. Search Google for relevant keywords to understand the competitive landscape
-            3. Examine top-ranking competitor pages
-            4. Identify content gaps and opportunities
-
-            Provide a comprehensive report of your findings.
-            """,
-            model="gpt-4o",
-            tools=[search_google, fetch_url_content],
-        )
+    def set(self, key: Hashable, value: _V):
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        # Evict the oldest entries once over capacity (dicts keep insertion order)
+        while len(self._entries) > self._maxsize:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+            self._locks.pop(oldest, None)
 
-        # Agent for analyzing search results
-        self.analysis_agent = Agent(
-            name="AIO Analyzer",
-            instructions="""
-            You are an expert AI-powered search optimization analyst. Analyze the investigation report and data
-            to identify optimization opportunities. Focus on:
-            - Keyword rankings and gaps
-            - Competitor content strategies
-            - Technical search optimization factors (titles, meta descriptions, content quality)
-            - Content quality indicators
-            - On-page optimization elements
-
-            Provide specific insights based on the data.
-            """,
-            model="gpt-4o",
-        )
+    def lock(self, key: Hashable) -> asyncio.Lock:
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def release_lock(self, key: Hashable, lock: asyncio.Lock):
+        # Only drop the lock we were handed; a newer one may already replace it
+        if self._locks.get(key) is lock:
+            del self._locks[key]
+
+
+def _host(url: str) -> str:
+    """Lowercased hostname of a URL without a leading "www." ("" if it has none)"""
+    return (urlparse(url).hostname or "").removeprefix("www.")
+
+
+def _same_site(host: str, target_host: str) -> bool:
+    """True if ``host`` is ``target_host`` or one of its subdomains"""
+    return host == target_host or host.endswith("." + target_host)
 
-        # Agent for generating recommendations
-        self.optimization_agent = Agent(
-            name="AIO Optimizer",
-            instructions="""
-            You are an expert AI-powered search optimization strategist. Based on analysis data, provide
-            specific, actionable optimization recommendations. Include:
-            - On-page improvements (titles, meta descriptions, headings)
-            - Content optimization strategies
-            - Technical optimization enhancements
-            - Link building opportunities
-            - Competitive advantages to leverage
-
-            Provide clear, prioritized action items with specific examples.
-            """,
-            model="gpt-4o",
-            handoffs=[self.analysis_agent],  # Can hand off to analyzer if needed
+
+def _rank_in_results(
+    results: Dict[str, Any], target_host: str
+) -> Tuple[Optional[int], List[str]]:
+    """
+    Find the target site's position in one keyword's search results.
+
+    Returns:
+        Tuple of (1-based rank in the top 20 or None, top-5 competitor URLs)
+    """
+    organic_results = results.get("organic_results", [])
+    rank = None
+
+    for idx, result in enumerate(organic_results[:20], start=1):
+        if _same_site(_host(result.get("link", "")), target_host):
+            rank = idx
+            break
+
+    competitors = []
+    for result in organic_results[:5]:
+        competitor_url = result.get("link", "")
+        host = _host(competitor_url)
+        if host and not _same_site(host, target_host):
+            competitors.append(competitor_url)
+
+    return rank, competitors
+
+
+def _extract_page_summary(html: str) -> Dict[str, Any]:
+    """Extract title, meta description and cleaned text content from HTML"""
+    tree = LexborHTMLParser(html)
+
+    # Extract meta data
+    title = tree.css_first("title")
+    meta_desc = tree.css_first('meta[name="description"]')
+
+    # Remove script and style elements
+    for node in tree.css("script, style"):
+        node.decompose()
+
+    text = tree.body.text(separator=" ") if tree.body else ""
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+
+    return {
+        "title": title.text(strip=True) if title else "No title",
+        "meta_description": (
+            meta_desc.attributes.get("content") if meta_desc else "No description"
+        ),
+        "content": text[:2000],  # First 2000 chars
+        "content_length": len(text),
+    }
+
+
+# Caps in-flight SerpAPI searches so keyword fan-out stays under rate limits
+_serp_semaphore = asyncio.BoundedSemaphore(get_settings().serpapi.concurrency)
+_serp_rate_limiter = _RateLimiter(get_settings().serpapi.rate_limit)
+# Identical searches within the TTL are served without calling SerpAPI
+_serp_cache: _TTLCache[Dict[str, Any]] = _TTLCache(
+    maxsize=get_settings().serpapi.cache_size, ttl=get_settings().serpapi.cache_ttl
+)
+
+
+async def _serp_request(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call the SerpAPI search endpoint within the concurrency and rate limits.
+
+    Successful responses are cached by search parameters (query, location,
+    language, ...) for SERPAPI_CACHE_TTL seconds.
+    """
+    key = tuple(sorted((k, v) for k, v in params.items() if k != "api_key"))
+
+    results = _serp_cache.get(key)
+    if results is not None:
+        return results
+
+    lock = _serp_cache.lock(key)
+    try:
+        async with lock:
+            # Another request may have filled the entry while we waited
+            results = _serp_cache.get(key)
+            if results is not None:
+                return results
+
+            async with _serp_semaphore:
+                await _serp_rate_limiter.wait()
+                response = await get_http_client().get(SERPAPI_SEARCH_URL, params=params)
+
+            results = cast(Dict[str, Any], response.json())
+            if "error" not in results:
+                _serp_cache.set(key, results)
+    finally:
+        _serp_cache.release_lock(key, lock)
+
+    return results
+
+
+# Agent tools and agents are stateless, so they are built once per process and
+# shared by every investigation. Tools are async so the agent runner can
+# execute several tool calls from one turn concurrently.
+@function_tool
+async def search_google(query: str, location: str = "United States") -> str:
+    """
+    Search Google for a query and return results.
+
+    Args:
+        query: The search query
+        location: Geographic location for search
+
+    Returns:
+        JSON string with search results
+    """
+    results = await _serp_request({
+        "engine": "google",
+        "q": query,
+        "location": location,
+        "api_key": get_settings().serpapi.api_key,
+    })
+
+    # Return top 5 organic results
+    organic = results.get("organic_results", [])[:5]
+    return json.dumps({
+        "query": query,
+        "results": [
+            {
+                "title": r.get("title"),
+                "link": r.get("link"),
+                "snippet": r.get("snippet"),
+                "position": r.get("position"),
+            }
+            for r in organic
+        ]
+    }, separators=(",", ":"))
+
+
+@function_tool
+async def fetch_url_content(url: str) -> str:
+    """
+    Fetch and extract main content from a URL.
+
+    Args:
+        url: The URL to fetch
+
+    Returns:
+        Main text content from the page
+    """
+    try:
+        html = await fetch_html(
+            url, user_agent="Mozilla/5.0 (compatible; SEOBot/1.0)", timeout=10
         )
 
+        # HTML parsing is CPU-bound; keep it off the event loop
+        page = await asyncio.to_thread(_extract_page_summary, html)
+        return json.dumps({"url": url, **page}, separators=(",", ":"))
+
+    except Exception as e:
+        return json.dumps({"error": str(e), "url": url})
+
+
+# Agent for web investigation
+investigator_agent = Agent(
+    name="Web Investigator",
+    instructions="""
+    You are a web research specialist. Your job is to investigate URLs and gather data.
+
+    Use the available tools to:
+    1. Fetch and analyze the target URL's content
+    2. Search Google for relevant keywords to understand the competitive landscape
+    3. Examine top-ranking competitor pages
+    4. Identify content gaps and opportunities
+
+    Provide a comprehensive report of your findings.
+    """,
+    model="gpt-4o",
+    tools=[search_google, fetch_url_content],
+)
+
+# Agent for analyzing search results
+analysis_agent = Agent(
+    name="AIO Analyzer",
+    instructions="""
+    You are an expert AI-powered search optimization analyst. Analyze the investigation report and data
+    to identify optimization opportunities. Focus on:
+    - Keyword rankings and gaps
+    - Competitor content strategies
+    - Technical search optimization factors (titles, meta descriptions, content quality)
+    - Content quality indicators
+    - On-page optimization elements
+
+    Provide specific insights based on the data.
+    """,
+    model="gpt-4o",
+)
+
+# Agent for generating recommendations
+optimization_agent = Agent(
+    name="AIO Optimizer",
+    instructions="""
+    You are an expert AI-powered search optimization strategist. Based on analysis data, provide
+    specific, actionable optimization recommendations. Include:
+    - On-page improvements (titles, meta descriptions, headings)
+    - Content optimization strategies
+    - Technical optimization enhancements
+    - Link building opportunities
+    - Competitive advantages to leverage
+
+    Provide clear, prioritized action items with specific examples.
+    """,
+    model="gpt-4o",
+    handoffs=[analysis_agent],  # Can hand off to analyzer if needed
+)
+
+
+class InvestigationService:
+    """Service for AIO (AI Optimization) investigation using OpenAI Agents and SerpAPI"""
+
+    def __init__(self):
+        settings = get_settings()
+        self.openai_api_key = settings.openai.api_key
+        self.serpapi_key = settings.serpapi.api_key
+
     async def search_google(
         self, query: str, location: str, language: str = "en"
     ) -> Dict[str, Any]:
         """Perform Google search via SerpAPI"""
         params = {
+            "engine": "google",
             "q": query,
             "location": location,
             "hl": language,
             "gl": language[:2],
             "api_key": self.serpapi_key,
         }
+        return await _serp_request(params)
 
-        # Run synchronous SerpAPI call in thread pool
-        loop = asyncio.get_event_loop()
-        search = await loop.run_in_executor(None, lambda: GoogleSearch(params))
-        results = await loop.run_in_executor(None, search.get_dict)
-
-        return results
-
-    async def analyze_rankings(
+    async def iter_rankings(
         self, url: str, keywords: List[str], location: str, language: str = "en"
-    ) -> Dict[str, Any]:
-        """Analyze current keyword rankings and competitor data"""
-        rankings = {}
-        all_competitors = set()
-
-        for keyword in keywords:
-            # Search for each keyword
-            results = await self.search_google(keyword, location, language)
+    ) -> AsyncIterator[Tuple[str, Optional[int], List[str]]]:
+        """
+        Search all keywords concurrently and yield each result as it arrives.
 
-            # Find target URL ranking
-            organic_results = results.get("organic_results", [])
-            rank = None
+        Yields:
+            Tuples of (keyword, rank or None, competitor URLs), in completion order
+        """
+        target_host = _host(url)
 
-            for idx, result in enumerate(organic_results[:20], start=1):
-                result_url = result.get("link", "")
-                if url.lower() in result_url.lower():
-                    rank = idx
-                    break
+        # Google matches queries case-insensitively, so keywords differing only
+        # in case or surrounding whitespace share one search
+        keywords_by_query: Dict[str, List[str]] = {}
+        for keyword in dict.fromkeys(keywords):
+            query = " ".join(keyword.lower().split())
+            keywords_by_query.setdefault(query, []).append(keyword)
 
-            rankings[keyword] = rank
+        async def search(query: str) -> Tuple[str, Dict[str, Any]]:
+            try:
+                return query, await self.search_google(query, location, language)
+            except Exception:
+                # A failed search leaves the keyword unranked instead of failing the run
+                return query, {}
 
-            # Collect competitor URLs
-            for result in organic_results[:5]:
-                competitor_url = result.get("link", "")
-                if competitor_url and url.lower() not in competitor_url.lower():
-                    all_competitors.add(competitor_url)
+        tasks = [asyncio.create_task(search(query)) for query in keywords_by_query]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                query, results = await next_done
+                rank, competitors = _rank_in_results(results, target_host)
+                for keyword in keywords_by_query[query]:
+                    yield keyword, rank, competitors
+        finally:
+            # Stop outstanding searches if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _merge_rankings(
+        keywords: List[str], per_keyword: Dict[str, Tuple[Optional[int], List[str]]]
+    ) -> Dict[str, Any]:
+        """Combine per-keyword results into rankings and up to 10 competitors"""
+        # First competitor URL seen per host, in keyword and ranking order
+        competitors: Dict[str, str] = {}
+        for keyword in keywords:
+            for competitor_url in per_keyword[keyword][1]:
+                competitors.setdefault(_host(competitor_url), competitor_url)
 
         return {
-            "rankings": rankings,
-            "competitors": list(all_competitors)[:10],
-            "search_results": results,
+            "rankings": {keyword: per_keyword[keyword][0] for keyword in keywords},
+            "competitors": list(competitors.values())[:10],
+        }
+
+    async def analyze_rankings(
+        self, url: str, keywords: List[str], location: str, language: str = "en"
+    ) -> Dict[str, Any]:
+        """Analyze current keyword rankings and competitor data"""
+        per_keyword = {
+            keyword: (rank, competitors)
+            async for keyword, rank, competitors in self.iter_rankings(
+                url, keywords, location, language
+            )
         }
+        return self._merge_rankings(keywords, per_keyword)
 
     async def investigate(
         self, url: str, keywords: List[str], location: str, language: str = "en"
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[bytes]:
         """
         Run AIO investigation process and stream results via SSE.
 
-        Yields JSON strings formatted for Server-Sent Events.
+        Yields JSON events already framed for Server-Sent Events.
         """
         task_id = str(uuid4())
+        investigation_task = None
 
         try:
             # Step 1: Initial status
@@ -229,7 +415,28 @@ class InvestigationService:
                 "progress": 0,
             })
 
-            await asyncio.sleep(0.5)  # Small delay for UX
+            investigation_context = f"""
+            Target URL: {url}
+            Keywords: {', '.join(keywords)}
+            Location: {location}
+
+            Please investigate:
+            1. Fetch and analyze the content from the target URL
+            2. Search Google for each keyword: {', '.join(keywords)}
+            3. Fetch content from the top 2-3 competitor URLs
+            4. Compare content quality, structure, and SEO elements
+
+            Provide a detailed investigation report.
+            """
+
+            # The investigator only needs the request inputs, so its agent run
+            # overlaps with the ranking analysis instead of waiting for it
+            investigation_task = asyncio.create_task(
+                Runner.run(
+                    starting_agent=investigator_agent,
+                    input=investigation_context,
+                )
+            )
 
             # Step 2: Analyze rankings
             yield self._format_sse({
@@ -238,7 +445,22 @@ class InvestigationService:
                 "progress": 20,
             })
 
-            analysis_data = await self.analyze_rankings(url, keywords, location, language)
+            # Report each keyword as its search completes instead of waiting
+            # for the slowest one
+            per_keyword = {}
+            total = len(set(keywords))
+            async for keyword, rank, competitors in self.iter_rankings(
+                url, keywords, location, language
+            ):
+                per_keyword[keyword] = (rank, competitors)
+                yield self._format_sse({
+                    "status": "analyzing",
+                    "message": f"Ranked {len(per_keyword)}/{total} keywords...",
+                    "progress": 20 + 20 * len(per_keyword) // total,
+                    "data": {"keyword": keyword, "rank": rank},
+                })
+
+            analysis_data = self._merge_rankings(keywords, per_keyword)
 
             yield self._format_sse({
                 "status": "analyzing",
@@ -250,31 +472,14 @@ class InvestigationService:
                 },
             })
 
-            # Step 3: Web investigation with agent tools
+            # Step 3: Web investigation with agent tools (started alongside step 2)
             yield self._format_sse({
                 "status": "analyzing",
                 "message": "Agent investigating target URL and competitors...",
                 "progress": 50,
             })
 
-            investigation_context = f"""
-            Target URL: {url}
-            Keywords: {', '.join(keywords)}
-            Location: {location}
-
-            Please investigate:
-            1. Fetch and analyze the content from the target URL
-            2. Search Google for each keyword: {', '.join(keywords)}
-            3. Fetch content from the top 2-3 competitor URLs
-            4. Compare content quality, structure, and SEO elements
-
-            Provide a detailed investigation report.
-            """
-
-            investigation_result = await Runner.run(
-                agent=self.investigator_agent,
-                input=investigation_context,
-            )
+            investigation_result = await investigation_task
 
             # Step 4: Run analysis agent
             yield self._format_sse({
@@ -287,14 +492,14 @@ class InvestigationService:
             Investigation Report:
             {investigation_result.final_output}
 
-            Current Rankings: {json.dumps(analysis_data['rankings'], indent=2)}
-            Top Competitors: {json.dumps(analysis_data['competitors'], indent=2)}
+            Current Rankings: {json.dumps(analysis_data['rankings'])}
+            Top Competitors: {json.dumps(analysis_data['competitors'])}
 
             Analyze this data and provide key SEO insights.
             """
 
             analysis_result = await Runner.run(
-                agent=self.analysis_agent,
+                starting_agent=analysis_agent,
                 input=analysis_context,
             )
 
@@ -317,7 +522,7 @@ class InvestigationService:
             """
 
             optimization_result = await Runner.run(
-                agent=self.optimization_agent,
+                starting_agent=optimization_agent,
                 input=optimization_context,
             )
 
@@ -349,22 +554,20 @@ class InvestigationService:
                 "progress": 0,
             })
 
+        finally:
+            # Stop the agent run if the stream failed or the client went away
+            if investigation_task is not None:
+                investigation_task.cancel()
+
     def _parse_recommendations(self, text: str) -> List[str]:
         """Parse recommendations from agent output"""
-        lines = text.strip().split('\n')
-        recommendations = []
-
-        for line in lines:
-            line = line.strip()
-            # Look for numbered items or bullet points
-            if line and (line[0].isdigit() or line.startswith('-') or line.startswith('•')):
-                # Remove number/bullet and clean up
-                cleaned = line.lstrip('0123456789.-•) ').strip()
-                if cleaned:
-                    recommendations.append(cleaned)
-
-        return recommendations if recommendations else [text]
-
-    def _format_sse(self, data: Dict[str, Any]) -> str:
+        recommendations = [
+            match.group(1)
+            for line in text.splitlines()
+            if (match := _RECOMMENDATION_RE.match(line))
+        ]
+        return recommendations or [text]
+
+    def _format_sse(self, data: Dict[str, Any]) -> bytes:
         """Format data as Server-Sent Event"""
-        return f"data: {json.dumps(data)}\n\n"
+        return b"data: " + orjson.dumps(data) + b"\n\n"
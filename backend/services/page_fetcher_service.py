@@ -1,75 +1,75 @@
+import asyncio
+import re
 from typing import Dict, Any
-import requests
-from bs4 import BeautifulSoup
-from agents import Agent
+from selectolax.lexbor import LexborHTMLParser
+from agents import Agent, Runner, function_tool
+from services.web_service import fetch_html
 
 
-class PageFetcherService:
-    """Service for fetching web page content using an OpenAI Agent"""
+# Runs of horizontal whitespace (newlines are kept as line breaks)
+_INLINE_WHITESPACE_RE = re.compile(r"[^\S\n]+")
+
+
+def _extract_text(html: str) -> str:
+    """Extract plain text from HTML, dropping scripts, styles and page chrome"""
+    tree = LexborHTMLParser(html)
+
+    # Remove script and style elements
+    for node in tree.css("script, style, nav, footer, header"):
+        node.decompose()
+
+    text = tree.body.text(separator="\n") if tree.body else ""
 
-    def __init__(self):
-        self._setup_agent()
-
-    def _setup_agent(self):
-        """Initialize the page fetcher agent with web scraping tool"""
-
-        def fetch_page_content(url: str) -> str:
-            """
-            Fetch and extract plain text content from a web page.
-
-            Args:
-                url: The URL to fetch
-
-            Returns:
-                Plain text content from the page
-            """
-            try:
-                response = requests.get(
-                    url,
-                    timeout=15,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; AIOBot/1.0)"},
-                )
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-
-                # Get text
-                text = soup.get_text()
-
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (
-                    phrase.strip() for line in lines for phrase in line.split("  ")
-                )
-                clean_text = "\n".join(chunk for chunk in chunks if chunk)
-
-                return clean_text
-
-            except Exception as e:
-                return f"Error fetching page: {str(e)}"
-
-        # Create agent with page fetching tool
-        self.agent = Agent(
-            name="Page Fetcher",
-            instructions="""
-            You are a web page content fetcher. Your job is to retrieve the plain text
-            content of web pages using the fetch_page_content tool.
-
-            When given a URL:
-            1. Use the fetch_page_content tool to retrieve the page content
-            2. Return the plain text content cleanly formatted
-            3. If there's an error, report it clearly
-
-            Focus on extracting the main content without navigation, headers, or footers.
-            """,
-            model="gpt-4o",
-            tools=[fetch_page_content],
+    # Clean up whitespace
+    lines = (_INLINE_WHITESPACE_RE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+@function_tool
+async def fetch_page_content(url: str) -> str:
+    """
+    Fetch and extract plain text content from a web page.
+
+    Args:
+        url: The URL to fetch
+
+    Returns:
+        Plain text content from the page
+    """
+    try:
+        html = await fetch_html(
+            url, user_agent="Mozilla/5.0 (compatible; AIOBot/1.0)", timeout=15
         )
 
+        # HTML parsing is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(_extract_text, html)
+
+    except Exception as e:
+        return f"Error fetching page: {str(e)}"
+
+
+# Stateless, so one agent with the page fetching tool serves every request
+page_fetcher_agent = Agent(
+    name="Page Fetcher",
+    instructions="""
+    You are a web page content fetcher. Your job is to retrieve the plain text
+    content of web pages using the fetch_page_content tool.
+
+    When given a URL:
+    1. Use the fetch_page_content tool to retrieve the page content
+    2. Return the plain text content cleanly formatted
+    3. If there's an error, report it clearly
+
+    Focus on extracting the main content without navigation, headers, or footers.
+    """,
+    model="gpt-4o",
+    tools=[fetch_page_content],
+)
+
+
+class PageFetcherService:
+    """Service for fetching web page content using an OpenAI Agent"""
+
     async def fetch_page(self, url: str) -> Dict[str, Any]:
         """
         Fetch page content using the agent.
@@ -80,10 +80,8 @@ class PageFetcherService:
         Returns:
             Dictionary with url and content
         """
-        from agents import Runner
-
         result = await Runner.run(
-            agent=self.agent,
+            starting_agent=page_fetcher_agent,
             input=f"Please fetch the content from this URL: {url}",
         )
 
@@ -1,6 +1,7 @@
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, Tuple, cast
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import CursorResult, select, update, delete, func
 from sqlalchemy.exc import IntegrityError
 from passlib.context import CryptContext
 from models.user import User
@@ -8,6 +9,10 @@ from models.user import User
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified against when no user matches, so unknown emails take as long as
+# wrong passwords and can't be told apart by response time
+_DUMMY_PASSWORD_HASH = "$2b$12$qcQTCxxD6cynt3ONNaCO/.gkCaeO0MnLqKP1g0mTyvXlGF7B/qwrO"
+
 
 class UserService:
     """Service layer for user operations with dependency injection"""
@@ -58,6 +63,37 @@ class UserService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_with_total(self, skip: int = 0, limit: int = 100) -> Tuple[List[User], int]:
+        """
+        Get a page of users together with the total user count.
+
+        The total is computed with a ``COUNT(*) OVER()`` window in the same
+        query, so a page costs one round-trip instead of two.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of User objects, total user count)
+        """
+        total = func.count().over().label("total")
+        stmt = (
+            select(User, total)
+            .offset(skip)
+            .limit(limit)
+            .order_by(User.created_at.desc())
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        if not rows:
+            # An empty page carries no window value; only past-the-end pages
+            # need a separate count
+            return [], await self.count() if skip else 0
+
+        return [row.User for row in rows], rows[0].total
+
     async def count(self) -> int:
         """
         Count total number of users.
@@ -65,7 +101,7 @@ class UserService:
         Returns:
             Total user count
         """
-        stmt = select(func.count(User.id))
+        stmt = select(func.count()).select_from(User)
         result = await self.db.execute(stmt)
         return result.scalar_one()
 
@@ -84,10 +120,11 @@ class UserService:
             Created User object or None if email already exists
         """
         try:
-            hashed_password = pwd_context.hash(password)
+            # bcrypt is deliberately slow; hash off the event loop
+            hashed_password = await asyncio.to_thread(pwd_context.hash, password)
             user = User(email=email, hashed_password=hashed_password, full_name=full_name)
             self.db.add(user)
-            await self.db.flush()
+            await self.db.commit()
             await self.db.refresh(user)
             return user
         except IntegrityError:
@@ -113,20 +150,37 @@ class UserService:
         Returns:
             Updated User object or None if not found
         """
-        user = await self.get_by_id(user_id)
-        if not user:
+        values = {
+            key: value
+            for key, value in (
+                ("email", email),
+                ("full_name", full_name),
+                ("is_active", is_active),
+            )
+            if value is not None
+        }
+        if not values:
+            return await self.get_by_id(user_id)
+
+        # MySQL has no UPDATE ... RETURNING, so update in place and read the
+        # row back: two round-trips instead of select + update + refresh
+        update_stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        update_result = cast(CursorResult, await self.db.execute(update_stmt))
+        if not update_result.rowcount:
+            await self.db.rollback()
             return None
 
-        if email is not None:
-            user.email = email
-        if full_name is not None:
-            user.full_name = full_name
-        if is_active is not None:
-            user.is_active = is_active
-
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+        await self.db.commit()
+        select_stmt = (
+            select(User).where(User.id == user_id).execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(select_stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, user_id: int) -> bool:
         """
@@ -138,13 +192,13 @@ class UserService:
         Returns:
             True if deleted, False if not found
         """
-        user = await self.get_by_id(user_id)
-        if not user:
-            return False
-
-        await self.db.delete(user)
-        await self.db.flush()
-        return True
+        # Delete by key without loading the row first
+        stmt = delete(User).where(User.id == user_id).execution_options(
+            synchronize_session=False
+        )
+        result = cast(CursorResult, await self.db.execute(stmt))
+        await self.db.commit()
+        return result.rowcount > 0
 
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -157,7 +211,7 @@ class UserService:
         Returns:
             True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
 
     async def authenticate(self, email: str, password: str) -> Optional[User]:
         """
@@ -171,7 +225,9 @@ class UserService:
             User object if authentication successful, None otherwise
         """
         user = await self.get_by_email(email)
-        if not user:
+
+        if user is None:
+            await self.verify_password(password, _DUMMY_PASSWORD_HASH)
             return None
         if not await self.verify_password(password, user.hashed_password):
             return None
@@ -0,0 +1,82 @@
+import asyncio
+import weakref
+from typing import Optional
+import httpx
+
+# Pages are read up to this size; enough for the head and main content
+MAX_PAGE_BYTES = 256 * 1024
+
+# One pooled client per event loop, shared by every web service in the worker.
+# Keyed weakly by loop so clients of finished loops (tests, reloads) go away.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for the running event loop.
+
+    The client is created on first use, so TLS/HTTP2 connections are reused
+    across services and requests instead of re-established per call.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30,
+        )
+        _CLIENTS[loop] = client
+    return client
+
+
+async def close_http_clients():
+    """Close all shared HTTP clients (called on application shutdown)"""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def fetch_html(
+    url: str,
+    user_agent: str,
+    timeout: Optional[float] = None,
+    max_bytes: int = MAX_PAGE_BYTES,
+) -> str:
+    """
+    Fetch a page with the shared client and return its decoded body.
+
+    The body is streamed and reading stops after ``max_bytes``, so very
+    large pages don't have to be downloaded and held in memory in full.
+
+    Args:
+        url: The URL to fetch
+        user_agent: User-Agent header to send
+        timeout: Optional per-request timeout overriding the client default
+        max_bytes: Maximum number of (decompressed) body bytes to read
+
+    Returns:
+        Response body as text, truncated to ``max_bytes``
+
+    Raises:
+        httpx.HTTPError: On network errors or non-2xx responses
+    """
+    body = bytearray()
+    async with get_http_client().stream(
+        "GET",
+        url,
+        follow_redirects=True,
+        headers={"User-Agent": user_agent},
+        timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+    ) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= max_bytes:
+                break
+
+    # The cap may split a multi-byte character; replace it rather than fail
+    return body[:max_bytes].decode(response.encoding or "utf-8", errors="replace")
@@ -1,47 +1,249 @@
 import os
-from dotenv import load_dotenv
+import sys
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from typing import Mapping, Optional
+from urllib.parse import quote
 
-# Load environment variables from .env file
-load_dotenv()
+# Short identifier-like values that are compared across the app. They are interned
+# so each worker keeps one shared copy and == short-circuits on identity.
+_INTERNED_FIELDS = frozenset({"api_version", "release_stage", "algorithm"})
 
-# Application Info
-API_TITLE = os.getenv("API_TITLE", "AI Optimizer API")
-API_VERSION = os.getenv("API_VERSION", "1.0.0")
 
-# Environment
-RELEASE_STAGE = os.getenv("RELEASE_STAGE", "local")
+@lru_cache(maxsize=None)
+def _env_fields(cls: type, prefix: str) -> tuple:
+    """
+    (environment variable, field name, cast) for every field of a settings class.
 
-# URLs
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+    Nested settings groups are skipped; they read their own prefixed variables.
+    """
+    return tuple(
+        (prefix + f.name.upper(), f.name, sys.intern if f.name in _INTERNED_FIELDS else f.type)
+        for f in fields(cls)
+        if f.init and not is_dataclass(f.type)
+    )
 
-# Database
-DATABASE_HOST = os.getenv("DATABASE_HOST", "localhost")
-DATABASE_PORT = os.getenv("DATABASE_PORT", "3306")
-DATABASE_USER = os.getenv("DATABASE_USER", "root")
-DATABASE_PASSWORD = os.getenv("DATABASE_PASSWORD", "password")
-DATABASE_NAME = os.getenv("DATABASE_NAME", "aioptimizer")
 
-# Construct database URL
-DATABASE_URL = f"mysql+pymysql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
+def _load_env(cls: type, prefix: str = "", environ: Mapping[str, str] = os.environ, **values):
+    """
+    Build a settings dataclass from environment variables.
 
-# Redis (for caching and background jobs)
-REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", "6379")
-REDIS_DB = os.getenv("REDIS_DB", "0")
-REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+    Each field reads the upper-cased, prefixed variable of the same name and is
+    cast to its annotated type, so callers always get real ints and floats.
+    Unset variables fall back to the field default. Extra keyword values
+    (e.g. nested groups) are passed through to the constructor.
+    """
+    for variable, name, cast in _env_fields(cls, prefix):
+        raw = environ.get(variable)
+        if raw is not None:
+            values[name] = cast(raw)
+    return cls(**values)
 
-# JWT Authentication
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
-# File Upload
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
-MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", "10485760"))  # 10MB default
+_OPENAI_PREFIX = "OPENAI_"
+_SERPAPI_PREFIX = "SERPAPI_"
 
-# OpenAI Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
-# SerpAPI Configuration
-SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY", "")
+@dataclass(frozen=True, slots=True)
+class OpenAISettings:
+    """OpenAI configuration (OPENAI_* variables)"""
+
+    api_key: str = field(default="", repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class SerpAPISettings:
+    """SerpAPI configuration (SERPAPI_* variables)"""
+
+    api_key: str = field(default="", repr=False)
+    concurrency: int = 10  # Max in-flight searches
+    rate_limit: float = 0  # Searches per second, 0 = unlimited
+    cache_ttl: int = 900  # Seconds to reuse identical searches
+    cache_size: int = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application configuration, resolved once from the environment"""
+
+    # Application Info
+    api_title: str = "AI Optimizer API"
+    api_version: str = "1.0.0"
+
+    # Environment
+    release_stage: str = "local"
+
+    # URLs
+    frontend_url: str = "http://localhost:3000"
+    backend_url: str = "http://localhost:8000"
+
+    # Database
+    database_host: str = "localhost"
+    database_port: str = "3306"
+    database_user: str = "root"
+    database_password: str = field(default="password", repr=False)
+    database_name: str = "aioptimizer"
+
+    # Database connection pool (per worker)
+    database_pool_size: int = 50
+    database_max_overflow: int = 100
+    database_pool_timeout: int = 10  # Seconds to wait for a connection
+    database_pool_recycle: int = 1800  # Keep below MySQL wait_timeout
+
+    # Redis (for caching and background jobs). Host, port and db are typed so
+    # clients can be built directly, e.g. Redis(host=..., port=..., db=...),
+    # without parsing redis_url.
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+
+    # JWT Authentication
+    secret_key: str = field(default="your-secret-key-change-this-in-production", repr=False)
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
+
+    # File Upload
+    upload_dir: str = "uploads"
+    max_upload_size: int = 10_485_760  # 10MB default
+
+    # Integrations (OPENAI_* / SERPAPI_* variables)
+    openai: OpenAISettings = field(default_factory=OpenAISettings)
+    serpapi: SerpAPISettings = field(default_factory=SerpAPISettings)
+
+    # Derived values, filled in by __post_init__. Settings is a slotted
+    # dataclass (no instance __dict__, so no cached_property); these slots hold
+    # what would otherwise be cached.
+    database_url: str = field(init=False, repr=False, compare=False)
+    redis_url: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # Connection URLs are built once here and then reused.
+        # Credentials are percent-encoded with nothing left unescaped, so "@",
+        # "/", ":" or spaces in them can't break the URL.
+        user = quote(self.database_user, safe="")
+        password = quote(self.database_password, safe="")
+        object.__setattr__(self, "database_url", (
+            f"mysql+pymysql://{user}:{password}"
+            f"@{self.database_host}:{self.database_port}/{self.database_name}"
+        ))
+        object.__setattr__(
+            self, "redis_url", f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
+        )
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Build settings from environment variables, falling back to defaults"""
+        if environ is None:
+            environ = os.environ
+        settings: Settings = _load_env(
+            cls,
+            environ=environ,
+            openai=_load_env(OpenAISettings, _OPENAI_PREFIX, environ),
+            serpapi=_load_env(SerpAPISettings, _SERPAPI_PREFIX, environ),
+        )
+        return settings
+
+
+def environment_variables() -> list:
+    """Names of all environment variables read by the settings classes"""
+    return [
+        variable
+        for cls, prefix in (
+            (Settings, ""),
+            (OpenAISettings, _OPENAI_PREFIX),
+            (SerpAPISettings, _SERPAPI_PREFIX),
+        )
+        for variable, _, _ in _env_fields(cls, prefix)
+    ]
+
+
+_WATCHED_VARIABLES = tuple(environment_variables())
+
+
+# Local development config; deployed stages get their variables from the environment
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+
+@lru_cache(maxsize=1)
+def _ensure_dotenv() -> bool:
+    """
+    Load environment variables from the .env file, once per process.
+
+    Outside the local stage, settings_compiled.py (see settings_compile.py) is
+    used if it exists and no .env file is read, so deployed workers skip the
+    file entirely. In the local stage the .env file is loaded if it exists and
+    a stale compiled module never shadows it. Variables already set in the
+    environment always win.
+    """
+    try:
+        from settings_compiled import ENVIRONMENT
+    except ImportError:
+        ENVIRONMENT = {}
+
+    stage = os.environ.get("RELEASE_STAGE", ENVIRONMENT.get("RELEASE_STAGE", "local"))
+    if stage != "local":
+        for name, value in ENVIRONMENT.items():
+            os.environ.setdefault(name, value)
+    elif os.path.isfile(_DOTENV_PATH):
+        # Imported here so deployed workers never load the .env parser
+        from _envfile import load_envfile
+
+        load_envfile(_DOTENV_PATH)
+    return True
+
+
+@lru_cache(maxsize=4)
+def _build_settings(fingerprint: tuple) -> Settings:
+    """Build and validate settings for one snapshot of the watched variables"""
+    settings = Settings.from_env({
+        name: value for name, value in zip(_WATCHED_VARIABLES, fingerprint) if value is not None
+    })
+
+    # Tokens signed with an empty or the documented placeholder key are forgeable
+    if settings.release_stage != "local" and (
+        not settings.secret_key or settings.secret_key.startswith("your-secret-key")
+    ):
+        raise RuntimeError(
+            f"SECRET_KEY must be set to a real secret when RELEASE_STAGE={settings.release_stage!r}"
+        )
+
+    return settings
+
+
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings.
+
+    Settings are cached by the current values of every variable they read, so
+    repeated calls return the same instance, while changing the environment
+    (e.g. monkeypatch.setenv in tests) yields fresh settings without having to
+    clear any cache.
+
+    Raises:
+        RuntimeError: If SECRET_KEY is empty or still the placeholder outside local
+    """
+    _ensure_dotenv()
+    env = os.environ
+    return _build_settings(tuple(env.get(name) for name in _WATCHED_VARIABLES))
+
+
+# Old constant prefixes that now live in a sub-settings group
+_GROUPS = {"OPENAI": "openai", "SERPAPI": "serpapi"}
+
+_MISSING = object()
+
+
+def __getattr__(name: str):
+    """
+    Keep the old module constants working (``from settings import API_TITLE``)
+    by resolving them from the settings singleton on first access.
+    """
+    if name.isupper():
+        settings, field = get_settings(), name
+        group, _, rest = name.partition("_")
+        if group in _GROUPS:
+            settings, field = getattr(settings, _GROUPS[group]), rest
+        value = getattr(settings, field.lower(), _MISSING)
+        if value is not _MISSING:
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,56 @@
+"""
+Compile the current configuration into settings_compiled.py.
+
+Reads the environment (plus backend/.env, if present) and writes the values of
+every known setting as Python literals. Outside the local stage, settings.py
+uses settings_compiled.py instead of parsing a .env file, and its bytecode is
+cached like any other module. The local stage always reads .env. Variables set
+in the real environment still override it.
+
+Usage (e.g. as a build step for production images):
+
+    python settings_compile.py            # writes settings_compiled.py
+    python settings_compile.py -o path.py
+"""
+import argparse
+import os
+import pprint
+import sys
+from _envfile import load_envfile
+import settings
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings_compiled.py")
+
+HEADER = '''"""
+Compiled settings, generated by settings_compile.py. Do not edit; re-run the
+compiler instead. Contains secrets, so never commit this file.
+"""
+
+'''
+
+
+def compile_settings() -> str:
+    """Render the configured environment variables as a Python module"""
+    if os.path.isfile(settings._DOTENV_PATH):
+        load_envfile(settings._DOTENV_PATH)
+
+    environment = {
+        name: os.environ[name]
+        for name in settings.environment_variables()
+        if name in os.environ
+    }
+    return HEADER + "ENVIRONMENT = " + pprint.pformat(environment, sort_dicts=False) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="File to write")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as f:
+        f.write(compile_settings())
+    sys.stderr.write(f"Wrote {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from routers.investigation import _coalesce_events
+
+
+async def events_from(*items):
+    for item in items:
+        yield item
+
+
+async def test_coalesces_events_into_one_frame():
+    frames = [frame async for frame in _coalesce_events(events_from("a", b"b", "c"))]
+
+    assert frames == [b"abc"]
+
+
+async def test_flushes_after_max_delay():
+    loop = asyncio.get_running_loop()
+    flushed_at = []
+
+    async def slow_source():
+        yield "first"
+        await asyncio.sleep(0.2)
+        yield "second"
+
+    start = loop.time()
+    frames = []
+    async for frame in _coalesce_events(slow_source(), max_delay=0.02):
+        frames.append(frame)
+        flushed_at.append(loop.time() - start)
+
+    assert frames == [b"first", b"second"]
+    # The first event is sent after max_delay, not held until the next one
+    assert flushed_at[0] < 0.15
+
+
+async def test_flushes_at_max_bytes():
+    frames = [
+        frame
+        async for frame in _coalesce_events(
+            events_from("aaaa", "bbbb", "cc", "dddd"), max_bytes=8, max_delay=10
+        )
+    ]
+
+    assert frames == [b"aaaabbbb", b"ccdddd"]
+
+
+async def test_reraises_source_errors():
+    async def failing_source():
+        yield "before"
+        raise RuntimeError("source failed")
+
+    frames = []
+    with pytest.raises(RuntimeError, match="source failed"):
+        async for frame in _coalesce_events(failing_source()):
+            frames.append(frame)
+
+    assert frames == [b"before"]
+
+
+async def test_aclose_cancels_the_producer():
+    cancelled = asyncio.Event()
+
+    async def endless_source():
+        try:
+            while True:
+                yield "tick"
+                await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    frames = _coalesce_events(endless_source(), max_delay=0.01)
+    assert (await anext(frames)).startswith(b"tick")
+
+    await frames.aclose()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+from _envfile import load_envfile, parse_envfile
+
+ENV_EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env.example")
+
+
+def write_env(tmp_path, content: str) -> str:
+    path = tmp_path / ".env"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_env_example_parses():
+    values = parse_envfile(ENV_EXAMPLE)
+
+    assert values["RELEASE_STAGE"] == "local"
+    assert values["API_TITLE"] == "AI Optimizer API"
+    assert values["MAX_UPLOAD_SIZE"] == "10485760"
+    assert values["SERPAPI_RATE_LIMIT"] == "0"
+    assert values["SERPAPI_CACHE_TTL"] == "900"
+    assert not any(name.startswith("#") for name in values)
+
+
+def test_env_example_covers_every_setting():
+    from settings import environment_variables
+
+    assert set(environment_variables()) <= set(parse_envfile(ENV_EXAMPLE))
+
+
+def test_comments_and_blank_lines_are_skipped(tmp_path):
+    path = write_env(tmp_path, "# comment\n\n   # indented comment\nKEY=value\n")
+
+    assert parse_envfile(path) == {"KEY": "value"}
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("KEY=value # comment", "value"),
+        ("KEY=value\t# comment", "value"),
+        ("KEY=value  \t  # comment", "value"),
+        ("KEY=value#not-a-comment", "value#not-a-comment"),
+        ("KEY= # only a comment", ""),
+    ],
+)
+def test_inline_comments(tmp_path, line, expected):
+    path = write_env(tmp_path, line + "\n")
+
+    assert parse_envfile(path)["KEY"] == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ('KEY="quoted value"', "quoted value"),
+        ("KEY='quoted value'", "quoted value"),
+        ('KEY="value # not a comment"', "value # not a comment"),
+        ("KEY='value # not a comment'", "value # not a comment"),
+        ('KEY="value" # comment', "value"),
+        ("KEY='value'\t# comment", "value"),
+        ('KEY=""', ""),
+    ],
+)
+def test_quoted_values(tmp_path, line, expected):
+    path = write_env(tmp_path, line + "\n")
+
+    assert parse_envfile(path)["KEY"] == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (r'KEY="a\nb"', "a\nb"),
+        (r'KEY="a\tb"', "a\tb"),
+        (r'KEY="say \"hi\""', 'say "hi"'),
+        (r'KEY="back\\slash"', "back\\slash"),
+        (r'KEY="keep \x as is"', r"keep \x as is"),
+        (r"KEY='no \n escapes'", r"no \n escapes"),
+    ],
+)
+def test_escapes(tmp_path, line, expected):
+    path = write_env(tmp_path, line + "\n")
+
+    assert parse_envfile(path)["KEY"] == expected
+
+
+def test_export_prefix(tmp_path):
+    path = write_env(tmp_path, "export A=1\nexport\tB=2\nexport   C='3'\nexported=4\n")
+
+    assert parse_envfile(path) == {"A": "1", "B": "2", "C": "3", "exported": "4"}
+
+
+def test_lines_without_assignment_are_ignored(tmp_path):
+    path = write_env(tmp_path, "NOT_AN_ASSIGNMENT\n=value\nKEY = value \n")
+
+    assert parse_envfile(path) == {"KEY": "value"}
+
+
+def test_load_envfile_keeps_existing_variables(tmp_path, monkeypatch):
+    path = write_env(tmp_path, "ENVFILE_SET=from-file\nENVFILE_NEW=from-file\n")
+    monkeypatch.setenv("ENVFILE_SET", "from-env")
+    monkeypatch.delenv("ENVFILE_NEW", raising=False)
+
+    load_envfile(path)
+
+    assert os.environ["ENVFILE_SET"] == "from-env"
+    assert os.environ["ENVFILE_NEW"] == "from-file"
+    monkeypatch.delenv("ENVFILE_NEW")
@@ -0,0 +1,22 @@
+import httpx
+import pytest
+
+from main import app
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/api/health", {"status": "healthy", "message": "API is running"}),
+        ("/optimize/health", {"status": "healthy"}),
+        ("/page-fetcher/health", {"status": "healthy"}),
+    ],
+)
+async def test_health_checks(path, body):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json().items() >= body.items()
@@ -0,0 +1,196 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+
+from services import investigation_service
+from services.investigation_service import InvestigationService, _TTLCache
+
+SEARCH_RESULTS = {
+    "organic_results": [
+        {"link": "https://competitor.com/a"},
+        {"link": "https://www.example.com/page"},
+        {"link": "https://other.org/b"},
+    ]
+}
+
+
+def parse_events(frames):
+    return [orjson.loads(frame.removeprefix(b"data: ")) for frame in frames]
+
+
+async def test_investigate_streams_every_step(monkeypatch):
+    agents = []
+
+    # Same signature as agents.Runner.run, so a wrong keyword fails the test
+    async def run(starting_agent, input, **kwargs):
+        agents.append(starting_agent)
+        return SimpleNamespace(final_output=f"{starting_agent.name} output\n1. Improve titles")
+
+    async def search_google(self, query, location, language="en"):
+        return SEARCH_RESULTS
+
+    monkeypatch.setattr(investigation_service.Runner, "run", run)
+    monkeypatch.setattr(InvestigationService, "search_google", search_google)
+
+    frames = [
+        frame
+        async for frame in InvestigationService().investigate(
+            "https://example.com", ["seo", "aio"], "United States"
+        )
+    ]
+    events = parse_events(frames)
+
+    assert [event["status"] for event in events][-1] == "completed"
+    assert "failed" not in [event["status"] for event in events]
+    ranked = [event["data"]["keyword"] for event in events if "keyword" in event.get("data", {})]
+    assert sorted(ranked) == ["aio", "seo"]
+    assert any(event["progress"] == 40 for event in events)
+
+    result = events[-1]["data"]
+    assert result["current_rankings"] == {"seo": 2, "aio": 2}
+    assert result["competitors"] == ["https://competitor.com/a", "https://other.org/b"]
+    assert result["recommendations"] == ["Improve titles"]
+    assert agents == [
+        investigation_service.investigator_agent,
+        investigation_service.analysis_agent,
+        investigation_service.optimization_agent,
+    ]
+
+
+async def test_investigate_reports_agent_failure(monkeypatch):
+    async def run(starting_agent, input, **kwargs):
+        raise RuntimeError("model unavailable")
+
+    async def search_google(self, query, location, language="en"):
+        return SEARCH_RESULTS
+
+    monkeypatch.setattr(investigation_service.Runner, "run", run)
+    monkeypatch.setattr(InvestigationService, "search_google", search_google)
+
+    events = parse_events([
+        frame
+        async for frame in InvestigationService().investigate(
+            "https://example.com", ["seo"], "United States"
+        )
+    ])
+
+    assert events[-1]["status"] == "failed"
+    assert "model unavailable" in events[-1]["message"]
+    # Rankings are still reported before the agent run is awaited
+    assert any(event["progress"] == 40 for event in events)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(investigation_service.time, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_expires_entries_and_their_locks(clock):
+    cache = _TTLCache(maxsize=10, ttl=60)
+    cache.lock("key")
+    cache.set("key", "value")
+
+    clock.now += 59
+    assert cache.get("key") == "value"
+
+    clock.now += 1
+    assert cache.get("key") is None
+    assert cache._entries == {}
+    assert cache._locks == {}
+
+
+def test_ttl_cache_evicts_oldest_entries_and_their_locks():
+    cache = _TTLCache(maxsize=2, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.lock(key)
+        cache.set(key, key.upper())
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+    assert cache.get("c") == "C"
+    assert set(cache._locks) == {"b", "c"}
+
+
+def test_ttl_cache_release_keeps_a_newer_lock():
+    cache = _TTLCache(maxsize=2, ttl=60)
+    old = cache.lock("key")
+    cache.release_lock("key", old)
+    new = cache.lock("key")
+
+    cache.release_lock("key", old)
+
+    assert cache.lock("key") is new
+
+
+@pytest.fixture
+def serpapi(monkeypatch):
+    """Fresh SerpAPI cache and a mock upstream; returns the received requests"""
+    requests = []
+    responses = {}
+
+    async def handler(request):
+        requests.append(request)
+        # Keep the request in flight so concurrent callers overlap
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=responses.get(request.url.params["q"], {"ok": True}))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(investigation_service, "_serp_cache", _TTLCache(maxsize=10, ttl=60))
+    monkeypatch.setattr(investigation_service, "get_http_client", lambda: client)
+    return SimpleNamespace(requests=requests, responses=responses)
+
+
+async def test_serp_request_coalesces_concurrent_misses(serpapi):
+    params = {"engine": "google", "q": "seo", "api_key": "secret"}
+
+    results = await asyncio.gather(
+        *(investigation_service._serp_request(params) for _ in range(5))
+    )
+
+    assert results == [{"ok": True}] * 5
+    assert len(serpapi.requests) == 1
+    assert investigation_service._serp_cache._locks == {}
+
+
+async def test_serp_request_cache_ignores_api_key(serpapi):
+    await investigation_service._serp_request({"q": "seo", "api_key": "one"})
+    await investigation_service._serp_request({"q": "seo", "api_key": "two"})
+
+    assert len(serpapi.requests) == 1
+
+
+async def test_serp_request_does_not_cache_errors(serpapi):
+    serpapi.responses["seo"] = {"error": "Rate limit exceeded"}
+
+    for _ in range(2):
+        assert await investigation_service._serp_request({"q": "seo"}) == {
+            "error": "Rate limit exceeded"
+        }
+
+    assert len(serpapi.requests) == 2
+    assert investigation_service._serp_cache._locks == {}
+
+
+async def test_serp_request_releases_lock_when_upstream_fails(serpapi, monkeypatch):
+    def fail():
+        raise httpx.ConnectError("unreachable")
+
+    monkeypatch.setattr(investigation_service, "get_http_client", fail)
+
+    with pytest.raises(httpx.ConnectError):
+        await investigation_service._serp_request({"q": "seo"})
+
+    assert investigation_service._serp_cache._locks == {}
@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+
+import models
+from models import init_db
+
+
+class FakeConnection:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.closed = False
+
+    async def execute(self, statement):
+        if self.fail:
+            raise ConnectionError("too many connections")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeEngine:
+    """Engine whose connections fail from the ``fail_from``-th checkout on"""
+
+    def __init__(self, fail_from: int):
+        self.fail_from = fail_from
+        self.connections = []
+
+    async def connect(self):
+        conn = FakeConnection(fail=len(self.connections) >= self.fail_from)
+        self.connections.append(conn)
+        return conn
+
+
+@pytest.fixture(autouse=True)
+def pool_size(monkeypatch):
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+
+
+async def test_init_db_warms_the_pool():
+    engine = FakeEngine(fail_from=5)
+
+    await init_db(engine)
+
+    assert len(engine.connections) == 5
+    assert all(conn.closed for conn in engine.connections)
+
+
+async def test_init_db_tolerates_warm_up_failures(caplog):
+    engine = FakeEngine(fail_from=2)
+
+    with caplog.at_level(logging.WARNING, logger=models.__name__):
+        await init_db(engine)
+
+    assert len(engine.connections) == 5
+    assert all(conn.closed for conn in engine.connections)
+    assert "opened 2 of 5 connections" in caplog.text
+
+
+async def test_init_db_requires_one_connection():
+    engine = FakeEngine(fail_from=0)
+
+    with pytest.raises(ConnectionError):
+        await init_db(engine)
+
+    assert engine.connections[0].closed
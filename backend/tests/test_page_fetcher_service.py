@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from services import page_fetcher_service
+from services.page_fetcher_service import PageFetcherService
+
+
+async def test_fetch_page_runs_the_agent(monkeypatch):
+    calls = []
+
+    # Same signature as agents.Runner.run, so a wrong keyword fails the test
+    async def run(starting_agent, input, **kwargs):
+        calls.append((starting_agent, input))
+        return SimpleNamespace(final_output="Page text")
+
+    monkeypatch.setattr(page_fetcher_service.Runner, "run", run)
+
+    result = await PageFetcherService().fetch_page("https://example.com")
+
+    assert result == {"url": "https://example.com", "content": "Page text", "status": "success"}
+    assert calls[0][0] is page_fetcher_service.page_fetcher_agent
+    assert "https://example.com" in calls[0][1]
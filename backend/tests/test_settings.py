@@ -0,0 +1,38 @@
+import pytest
+
+from settings import get_settings
+
+
+@pytest.mark.parametrize("secret_key", ["", "your-secret-key-change-this-in-production"])
+def test_missing_secret_key_fails_outside_local(monkeypatch, secret_key):
+    monkeypatch.setenv("RELEASE_STAGE", "production")
+    monkeypatch.setenv("SECRET_KEY", secret_key)
+
+    with pytest.raises(RuntimeError, match="SECRET_KEY"):
+        get_settings()
+
+
+def test_placeholder_secret_key_is_allowed_locally(monkeypatch):
+    monkeypatch.setenv("RELEASE_STAGE", "local")
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+
+    assert get_settings().secret_key.startswith("your-secret-key")
+
+
+def test_real_secret_key_is_accepted(monkeypatch):
+    monkeypatch.setenv("RELEASE_STAGE", "production")
+    monkeypatch.setenv("SECRET_KEY", "s3cret")
+
+    assert get_settings().secret_key == "s3cret"
+
+
+def test_legacy_constants_resolve_from_settings(monkeypatch):
+    import settings
+
+    monkeypatch.setenv("API_TITLE", "Legacy")
+    monkeypatch.setenv("SERPAPI_CONCURRENCY", "3")
+
+    assert settings.API_TITLE == "Legacy"
+    assert settings.SERPAPI_CONCURRENCY == 3
+    with pytest.raises(AttributeError, match="SERPAPI_NOPE"):
+        settings.SERPAPI_NOPE
@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from models import Base, create_session_maker
+from services.user_service import UserService
+
+
+@pytest.fixture
+async def service():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with create_session_maker(engine)() as db:
+        yield UserService(db)
+    await engine.dispose()
+
+
+async def test_update_changes_only_given_fields(service):
+    user = await service.create(email="a@example.com", password="12345678", full_name="A")
+
+    updated = await service.update(user.id, full_name="B")
+
+    assert updated.full_name == "B"
+    assert updated.email == "a@example.com"
+
+
+async def test_update_missing_user_returns_none(service):
+    assert await service.update(999, full_name="B") is None
+
+
+async def test_delete_reports_whether_a_row_was_removed(service):
+    user = await service.create(email="a@example.com", password="12345678")
+
+    assert await service.delete(user.id) is True
+    assert await service.delete(user.id) is False
+    assert await service.get_by_id(user.id) is None
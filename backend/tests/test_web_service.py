@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from services import web_service
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, text="hello world " * 100)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), timeout=7)
+    monkeypatch.setattr(web_service, "get_http_client", lambda: client)
+    return seen
+
+
+async def test_fetch_html_uses_client_timeout_by_default(requests):
+    await web_service.fetch_html("https://example.com", user_agent="test")
+
+    assert requests[0].extensions["timeout"]["read"] == 7
+    assert requests[0].headers["User-Agent"] == "test"
+
+
+async def test_fetch_html_overrides_timeout(requests):
+    await web_service.fetch_html("https://example.com", user_agent="test", timeout=2)
+
+    assert requests[0].extensions["timeout"]["read"] == 2
+
+
+async def test_fetch_html_truncates_body(requests):
+    html = await web_service.fetch_html("https://example.com", user_agent="test", max_bytes=11)
+
+    assert html == "hello world"